@@ -1,17 +1,20 @@
 import asyncio
-import itertools
 import json
 import logging
 import os
 import random
 import shutil
 import socket
+import sys
 from copy import deepcopy
 from pathlib import Path
-from subprocess import run
+from subprocess import STDOUT, run
 
 import pytest
 
+if sys.platform != "win32":
+    import uvloop
+
 from .node import Node
 
 # prepend the timestamp in front of any log line
@@ -20,6 +23,9 @@ logging.basicConfig(format="%(asctime)s %(message)s")
 SEED = int.from_bytes(os.urandom(8), byteorder="big")
 random.seed(SEED)
 
+# collection-time sampling uses a fixed default seed, so that every run and xdist worker collects the same parameters
+PARAMETRIZE_SEED = int(os.environ.get("HOPR_TEST_SEED", "0"))
+
 
 def pytest_addoption(parser: pytest.Parser):
     parser.addoption(
@@ -70,12 +76,14 @@ PASSWORD = "e2e-test"
 # /tmp/hopr-smoke-test/${SUITE_NAME}/hopr-node_*.log - log file for nodes
 # /tmp/hopr-smoke-test/${SUITE_NAME}/anvil.cfg - anvil configuration file
 # /tmp/hopr-smoke-test/${SUITE_NAME}/anvil.log - anvil configuration file
+# /tmp/hopr-smoke-test/${SUITE_NAME}/run-local-anvil.log - output of the last anvil start-up script run
 
 PWD = Path(__file__).parent
 
 def fixtures_dir(name: str): return Path(f"/tmp/hopr-smoke-test/{name}")
 def anvil_cfg_file(name: str): return Path(f"{fixtures_dir(name)}/anvil.cfg")
 def anvil_log_file(name: str): return Path(f"{fixtures_dir(name)}/anvil.log")
+def anvil_script_log_file(name: str): return Path(f"{fixtures_dir(name)}/run-local-anvil.log")
 def protocol_config_file(name: str): return Path(f"{fixtures_dir(name)}/protocol-config.json")
 def snapshot_dir(parent_dir: Path): return parent_dir.joinpath("snapshot")
 def anvil_state_file(parent_dir: Path): return parent_dir.joinpath("anvil.state.json")
@@ -157,8 +165,26 @@ def nodes_with_different_network():
     return ["6", "7"]
 
 
-def random_distinct_pairs_from(values: list, count: int):
-    return random.sample([(left, right) for left, right in itertools.product(values, repeat=2) if left != right], count)
+def seeded_rng(module_name: str) -> random.Random:
+    """
+    Returns the generator for collection-time sampling in `module_name`, its draws depend only on PARAMETRIZE_SEED and
+    the module, not on which other modules were collected before it.
+    """
+    return random.Random(f"{PARAMETRIZE_SEED}:{module_name}")
+
+
+def random_distinct_pairs_from(values: list, count: int, rng=random):
+    # draw pairs one at a time instead of materializing the whole cross product
+    if count > len(values) * (len(values) - 1):
+        raise ValueError("Sample larger than the number of distinct pairs")
+
+    seen, pairs = set(), []
+    while len(pairs) < count:
+        pair = tuple(rng.sample(values, 2))
+        if pair not in seen:
+            seen.add(pair)
+            pairs.append(pair)
+    return pairs
 
 
 def check_socket(address: str, port: str):
@@ -192,6 +218,18 @@ def mirror_contract_data(dest_file_path: Path, src_file_path: Path, src_network:
         json.dump(dest_data, file, sort_keys=True)
 
 
+def run_local_anvil(test_suite_name: str, *args):
+    # stream the script output straight into a log file instead of buffering it in memory
+    with open(anvil_script_log_file(test_suite_name), "wb") as log_file:
+        run(
+            ["./run-local-anvil.sh", *args],
+            check=True,
+            stdout=log_file,
+            stderr=STDOUT,
+            cwd=PWD.parent.joinpath("scripts"),
+        )
+
+
 def cleanup_data(parent_dir: Path):
     # Remove old db
     for f in parent_dir.glob(f"{NODE_NAME_PREFIX}_*"):
@@ -398,8 +436,11 @@ def load_private_key(test_suite_name, pos = 0):
 
 @pytest.fixture(scope="module")
 def event_loop():
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
+    # uvloop has no Windows support, fall back to the default policy there
+    if sys.platform != "win32":
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
@@ -416,7 +457,7 @@ async def paths(request):
 
 @pytest.fixture(scope="module")
 async def swarm7(request):
-    logging.info(f"Using the random seed: {SEED}")
+    logging.info(f"Using the random seed: {SEED}, parametrize seed: {PARAMETRIZE_SEED}")
 
     # PREPARE TEST SUITE ENVIRONMENT
     test_suite = request.module
@@ -445,12 +486,16 @@ async def swarm7(request):
 
         # START NEW LOCAL ANVIL SERVER
         logging.info("Starting and waiting for local anvil server to be up (dump state enabled)")
-        run(
-            f"./run-local-anvil.sh -l {anvil_log_file(test_suite_name)} -c {anvil_cfg_file(test_suite_name)} -p {anvil_port} -ds {anvil_state_file(test_dir)}"
-            .split(),
-            check=True,
-            capture_output=True,
-            cwd=PWD.parent.joinpath("scripts"),
+        run_local_anvil(
+            test_suite_name,
+            "-l",
+            anvil_log_file(test_suite_name),
+            "-c",
+            anvil_cfg_file(test_suite_name),
+            "-p",
+            str(anvil_port),
+            "-ds",
+            anvil_state_file(test_dir),
         )
 
         logging.info("Mirror contract data because of anvil-deploy node only writing to localhost")
@@ -493,11 +538,17 @@ async def swarm7(request):
     snapshot_reuse(test_dir, nodes)
 
     logging.info("Starting and waiting for local anvil server to be up (load state enabled)")
-    run(
-        f"./run-local-anvil.sh -s -l {anvil_log_file(test_suite_name)} -c {anvil_cfg_file(test_suite_name)} -p {anvil_port} -ls {anvil_state_file(test_dir)}".split(),
-        check=True,
-        capture_output=True,
-        cwd=PWD.parent.joinpath("scripts"),
+    run_local_anvil(
+        test_suite_name,
+        "-s",
+        "-l",
+        anvil_log_file(test_suite_name),
+        "-c",
+        anvil_cfg_file(test_suite_name),
+        "-p",
+        str(anvil_port),
+        "-ls",
+        anvil_state_file(test_dir),
     )
 
     # SETUP NODES USING STORED IDENTITIES
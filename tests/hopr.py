@@ -1,5 +1,9 @@
 import asyncio
+import functools
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from typing import Callable, Optional
 
 import requests
@@ -40,6 +44,10 @@ def getlogger():
 log = getlogger()
 
 MESSAGE_TAG = 1234
+CONNECTION_POOL_MAXSIZE = 64
+
+# the default executor is capped at min(32, cpu + 4) workers, too few to keep a full connection pool busy
+_api_executor = ThreadPoolExecutor(max_workers=CONNECTION_POOL_MAXSIZE, thread_name_prefix="hoprd-api")
 
 
 class HoprdAPI:
@@ -51,18 +59,31 @@ class HoprdAPI:
         self.configuration = Configuration()
         self.configuration.host = url
         self.configuration.api_key["X-Auth-Token"] = token
+        self.configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+
+        # a single client keeps its connection pool, and thus keep-alive connections, across calls
+        self._exit_stack = ExitStack()
+        self.client = self._exit_stack.enter_context(ApiClient(self.configuration))
+
+    def close(self):
+        self._exit_stack.close()
+
+    async def __call_api(
+        self, obj: Callable[..., object], method: str, *args, **kwargs
+    ) -> tuple[bool, Optional[object]]:
+        # the generated SDK client is blocking, run it off the event loop so that concurrent calls can overlap
+        return await asyncio.get_running_loop().run_in_executor(
+            _api_executor, functools.partial(self.__call_api_blocking, obj, method, *args, **kwargs)
+        )
 
-    def __call_api(self, obj: Callable[..., object], method: str, *args, **kwargs) -> tuple[bool, Optional[object]]:
+    def __call_api_blocking(
+        self, obj: Callable[..., object], method: str, *args, **kwargs
+    ) -> tuple[bool, Optional[object]]:
         try:
-            with ApiClient(self.configuration) as client:
-                api_callback = getattr(obj(client), method)
-                kwargs["async_req"] = True
-                thread = api_callback(*args, **kwargs)
-                response = thread.get()
-                log.debug(
-                    f"Calling {api_callback.__qualname__} with kwargs: {kwargs}, args: {args}, response: {response}"
-                )
-                return (True, response)
+            api_callback = getattr(obj(self.client), method)
+            response = api_callback(*args, **kwargs)
+            log.debug(f"Calling {api_callback.__qualname__} with kwargs: {kwargs}, args: {args}, response: {response}")
+            return (True, response)
         except ApiException as e:
             log.debug(
                 f"ApiException calling {api_callback.__qualname__} with kwargs: {kwargs}, args: {args}, error is: {e}"
@@ -82,7 +103,7 @@ class HoprdAPI:
         Returns the aliases recognized by the node.
         :return: aliases: dict
         """
-        _, response = self.__call_api(AliasApi, "aliases")
+        _, response = await self.__call_api(AliasApi, "aliases")
         return response
 
     async def aliases_get_alias(self, alias: str):
@@ -90,7 +111,7 @@ class HoprdAPI:
         Returns the peer id recognized by the node.
         :return: peer_id: str
         """
-        status, response = self.__call_api(AliasApi, "get_alias", alias)
+        status, response = await self.__call_api(AliasApi, "get_alias", alias)
         return response.peer_id if status else None
 
     async def aliases_set_alias(self, alias: str, peer_id: str):
@@ -99,7 +120,7 @@ class HoprdAPI:
         :return: bool
         """
         body = AliasPeerIdBodyRequest(alias, peer_id)
-        status, _ = self.__call_api(AliasApi, "set_alias", body=body)
+        status, _ = await self.__call_api(AliasApi, "set_alias", body=body)
         return status
 
     async def aliases_remove_alias(self, alias: str):
@@ -107,7 +128,7 @@ class HoprdAPI:
         Returns the aliases recognized by the node.
         :return: bool
         """
-        status, _ = self.__call_api(AliasApi, "delete_alias", alias)
+        status, _ = await self.__call_api(AliasApi, "delete_alias", alias)
         return status
 
     async def addresses(self, address_type: str = "all"):
@@ -124,7 +145,7 @@ class HoprdAPI:
         if isinstance(address_type, str):
             address_type = [address_type]
 
-        status, response = self.__call_api(AccountApi, "addresses")
+        status, response = await self.__call_api(AccountApi, "addresses")
         if not status:
             return None
 
@@ -142,7 +163,7 @@ class HoprdAPI:
         Returns the balance of the node.
         :return: balances: dict | int
         """
-        status, response = self.__call_api(AccountApi, "balances")
+        status, response = await self.__call_api(AccountApi, "balances")
         return response if status else None
 
     async def open_channel(self, peer_address: str, amount: str):
@@ -154,7 +175,7 @@ class HoprdAPI:
         """
         body = OpenChannelBodyRequest(amount, peer_address)
 
-        status, response = self.__call_api(ChannelsApi, "open_channel", body=body)
+        status, response = await self.__call_api(ChannelsApi, "open_channel", body=body)
         return response.channel_id if status else None
 
     async def channels_fund_channel(self, channel_id: str, amount: str):
@@ -165,7 +186,7 @@ class HoprdAPI:
         :return: bool
         """
         body = FundBodyRequest(amount=amount)
-        status, _ = self.__call_api(ChannelsApi, "fund_channel", body, channel_id)
+        status, _ = await self.__call_api(ChannelsApi, "fund_channel", body, channel_id)
         return status
 
     async def close_channel(self, channel_id: str):
@@ -174,7 +195,7 @@ class HoprdAPI:
         :param: channel_id: str
         :return: bool
         """
-        status, _ = self.__call_api(ChannelsApi, "close_channel", channel_id)
+        status, _ = await self.__call_api(ChannelsApi, "close_channel", channel_id)
         return status
 
     async def channel_redeem_tickets(self, channel_id: str):
@@ -183,7 +204,7 @@ class HoprdAPI:
         :param: channel_id: str
         :return: bool
         """
-        status, _ = self.__call_api(ChannelsApi, "redeem_tickets_in_channel", channel_id)
+        status, _ = await self.__call_api(ChannelsApi, "redeem_tickets_in_channel", channel_id)
         return status
 
     async def incoming_channels(self, only_id: bool = False):
@@ -192,7 +213,7 @@ class HoprdAPI:
         :return: channels: list
         """
 
-        status, response = self.__call_api(
+        status, response = await self.__call_api(
             ChannelsApi, "list_channels", full_topology="false", including_closed="false"
         )
         if status:
@@ -216,7 +237,7 @@ class HoprdAPI:
         Returns all open outgoing channels.
         :return: channels: list
         """
-        status, response = self.__call_api(ChannelsApi, "list_channels")
+        status, response = await self.__call_api(ChannelsApi, "list_channels")
         if status:
             if not hasattr(response, "outgoing"):
                 log.warning("Response does not contain `outgoing`")
@@ -239,7 +260,7 @@ class HoprdAPI:
         :param: channel_id: str
         :return: channel: response
         """
-        _, response = self.__call_api(ChannelsApi, "show_channel", channel_id)
+        _, response = await self.__call_api(ChannelsApi, "show_channel", channel_id)
         return response
 
     async def channels_aggregate_tickets(self, channel_id: str):
@@ -248,7 +269,7 @@ class HoprdAPI:
         :param: channel_id: str
         :return: bool
         """
-        status, _ = self.__call_api(ChannelsApi, "aggregate_tickets_in_channel", channel_id)
+        status, _ = await self.__call_api(ChannelsApi, "aggregate_tickets_in_channel", channel_id)
         return status
 
     async def channel_get_tickets(self, channel_id: str):
@@ -257,7 +278,7 @@ class HoprdAPI:
         :param: channel_id: str
         :return: tickets: response
         """
-        status, response = self.__call_api(ChannelsApi, "show_channel_tickets", channel_id)
+        status, response = await self.__call_api(ChannelsApi, "show_channel_tickets", channel_id)
         return response if status else []
 
     async def all_channels(self, include_closed: bool):
@@ -266,7 +287,7 @@ class HoprdAPI:
         :param: include_closed: bool
         :return: channels: list
         """
-        status, response = self.__call_api(
+        status, response = await self.__call_api(
             ChannelsApi, "list_channels", full_topology="true", including_closed="true" if include_closed else "false"
         )
         return response if status else []
@@ -277,7 +298,7 @@ class HoprdAPI:
         :param: peer_id: str
         :return: response: dict
         """
-        _, response = self.__call_api(PeersApi, "ping_peer", peer_id)
+        _, response = await self.__call_api(PeersApi, "ping_peer", peer_id)
         return response
 
     async def peers(self, params: list or str = "peer_id", status: str = "connected"):
@@ -288,7 +309,7 @@ class HoprdAPI:
         :param: quality: int = 0..1
         :return: peers: list
         """
-        is_ok, response = self.__call_api(NodeApi, "peers")
+        is_ok, response = await self.__call_api(NodeApi, "peers")
         if is_ok:
             if not hasattr(response, status):
                 log.error(f"No `{status}` returned from the API")
@@ -317,7 +338,7 @@ class HoprdAPI:
         Returns the ticket statistics of the node.
         :return: statistics: dict
         """
-        _, response = self.__call_api(TicketsApi, "show_ticket_statistics")
+        _, response = await self.__call_api(TicketsApi, "show_ticket_statistics")
         return response
 
     async def send_message(self, destination: str, message: str, hops: list[str], tag: int = MESSAGE_TAG) -> bool:
@@ -330,7 +351,7 @@ class HoprdAPI:
         :return: bool
         """
         body = SendMessageBodyRequest(message, None, hops, destination, tag)
-        _, response = self.__call_api(MessagesApi, "send_message", body=body)
+        _, response = await self.__call_api(MessagesApi, "send_message", body=body)
         return response
 
     async def messages_pop(self, tag: int = MESSAGE_TAG) -> bool:
@@ -341,7 +362,18 @@ class HoprdAPI:
         """
 
         body = TagQueryRequest(tag=tag)
-        _, response = self.__call_api(MessagesApi, "pop", body=body)
+        _, response = await self.__call_api(MessagesApi, "pop", body=body)
+        return response
+
+    async def messages_pop_all(self, tag: int = MESSAGE_TAG) -> dict:
+        """
+        Pop all messages from the inbox
+        :param: tag = 0x0320
+        :return: dict
+        """
+
+        body = TagQueryRequest(tag=tag)
+        _, response = await self.__call_api(MessagesApi, "pop_all", body=body)
         return response
 
     async def messages_peek(self, tag: int = MESSAGE_TAG) -> dict:
@@ -352,7 +384,7 @@ class HoprdAPI:
         """
 
         body = TagQueryRequest(tag=tag)
-        _, response = self.__call_api(MessagesApi, "peek", body=body)
+        _, response = await self.__call_api(MessagesApi, "peek", body=body)
         return response
 
     async def messages_peek_all(self, tag: int = MESSAGE_TAG, timestamp: int = 0) -> dict:
@@ -366,7 +398,7 @@ class HoprdAPI:
         else:
             body = GetMessageBodyRequest(tag=tag, timestamp=timestamp)
 
-        _, response = self.__call_api(MessagesApi, "peek_all", body=body)
+        _, response = await self.__call_api(MessagesApi, "peek_all", body=body)
         return response
 
     async def tickets_redeem(self):
@@ -374,7 +406,7 @@ class HoprdAPI:
         Redeems all tickets.
         :return: bool
         """
-        status, _ = self.__call_api(TicketsApi, "redeem_all_tickets")
+        status, _ = await self.__call_api(TicketsApi, "redeem_all_tickets")
         return status
 
     async def ticket_price(self):
@@ -382,7 +414,7 @@ class HoprdAPI:
         Returns the ticket price in wei.
         :return: price: int
         """
-        _, response = self.__call_api(NetworkApi, "price")
+        _, response = await self.__call_api(NetworkApi, "price")
         return int(response.price) if hasattr(response, "price") else None
 
     async def session_client(self, destination: str, path: str, protocol: str, target: str, listen_on: str = "127.0.0.1:0", capabilities=None):
@@ -400,7 +432,7 @@ class HoprdAPI:
         else:
             body = SessionClientRequest(destination=destination, path=path, target=target, listen_host=listen_on, capabilities=capabilities)
 
-        _, response = self.__call_api(SessionApi, "create_client", body=body, protocol=protocol)
+        _, response = await self.__call_api(SessionApi, "create_client", body=body, protocol=protocol)
         return int(response.port) if hasattr(response, "port") else None
 
     async def session_list_clients(self, protocol: str):
@@ -408,7 +440,7 @@ class HoprdAPI:
         Returns opened session listeners.
         :return: sessions: dict
         """
-        _, response = self.__call_api(SessionApi, "list_clients", protocol=protocol)
+        _, response = await self.__call_api(SessionApi, "list_clients", protocol=protocol)
         return response
 
     async def session_close_client(self, protocol: str, bound_port: int, bound_ip: str = '127.0.0.1'):
@@ -417,7 +449,7 @@ class HoprdAPI:
         """
         body = SessionCloseClientRequest(listening_ip=bound_ip, port=bound_port)
 
-        status, _ = self.__call_api(SessionApi, "close_client", body=body, protocol=protocol)
+        status, _ = await self.__call_api(SessionApi, "close_client", body=body, protocol=protocol)
         return status
 
     async def ticket_winn_prob(self):
@@ -425,7 +457,7 @@ class HoprdAPI:
         Returns the ticket winning probability.
         :return: probability: float
         """
-        _, response = self.__call_api(NetworkApi, "probability")
+        _, response = await self.__call_api(NetworkApi, "probability")
         return getattr(response, "probability", None)
 
     async def withdraw(self, amount: str, receipient: str, currency: str):
@@ -437,7 +469,7 @@ class HoprdAPI:
         :return:
         """
         body = WithdrawBodyRequest(receipient, amount, currency)
-        status, response = self.__call_api(AccountApi, "withdraw", body=body)
+        status, response = await self.__call_api(AccountApi, "withdraw", body=body)
         return status, response
 
     async def startedz(self):
@@ -453,21 +485,28 @@ class HoprdAPI:
         return await is_url_returning_200(f"{self.configuration.host}/readyz")
 
 
+# requests.Session is not thread-safe, each probe thread keeps its own to reuse keep-alive connections
+_probe_sessions = threading.local()
+
+
 def query_url(url):
-    return requests.get(url, timeout=0.3)
+    session = getattr(_probe_sessions, "session", None)
+    if session is None:
+        session = _probe_sessions.session = requests.Session()
+    return session.get(url, timeout=0.3)
 
 
 async def is_url_returning_200(url, timeout=20):
     async def check_url():
         while True:
             try:
-                query_url(url)
-                break
+                # the probe is blocking, keep it off the event loop so concurrent checks are not serialized
+                return await asyncio.to_thread(query_url, url)
             except Exception:
                 await asyncio.sleep(0.2)
 
     try:
-        await asyncio.wait_for(check_url(), timeout=timeout)
-        return query_url(url).status_code == 200
+        response = await asyncio.wait_for(check_url(), timeout=timeout)
+        return response.status_code == 200
     except Exception:
         return False
@@ -51,12 +51,18 @@ class Node:
         self.api_port: int = 0
         self.p2p_port: int = 0
         self.anvil_port: int = 0
+        self._api: HoprdAPI = None
 
     @property
     def api(self):
-        return HoprdAPI(f"http://{self.host_addr}:{self.api_port}", self.api_token)
+        if self._api is None:
+            self._api = HoprdAPI(f"http://{self.host_addr}:{self.api_port}", self.api_token)
+        return self._api
 
     def prepare(self, port_base: int, parent_dir: Path, prefix: str):
+        if self._api is not None:
+            self._api.close()
+        self._api = None
         self.anvil_port = port_base
         self.dir = parent_dir.joinpath(f"{prefix}_{self.id}")
         self.cfg_file_path = parent_dir.joinpath(self.cfg_file)
@@ -166,6 +172,9 @@ class Node:
 
     def clean_up(self):
         self.proc.kill()
+        if self._api is not None:
+            self._api.close()
+            self._api = None
 
     def __str__(self):
         return f"node@{self.host_addr}:{self.p2p_port}"
@@ -1,4 +1,3 @@
-import random
 import json
 import logging
 import re
@@ -19,6 +18,7 @@ from .conftest import (
     barebone_nodes,
     fixtures_dir,
     load_private_key,
+    seeded_rng,
 )
 from .test_integration import (
     balance_str_to_int,
@@ -31,6 +31,8 @@ PASSWORD_NEW = "e2e-test-new"
 PORT_BASE = 19200
 ANVIL_ENDPOINT = f"http://127.0.0.1:{PORT_BASE}"
 
+_rng = seeded_rng(__name__)
+
 def run_cast_cmd(cmd: str, params: list[str]):
     cast_cmd = ["cast", cmd, "-r", ANVIL_ENDPOINT] + params
     logging.info("Running cast command: %s", ' '.join(cast_cmd))
@@ -328,7 +330,7 @@ def migrate_safe_module(private_key: str, manager_private_key: str, safe: str, m
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 @pytest.mark.xfail(reason="race-conditions lead to incorrect balances on nodes")
 async def test_hopli_should_be_able_to_fund_nodes(peer: str, swarm7: dict[str, Node]):
     test_suite_name = __name__.split('.')[-1]
@@ -358,7 +360,7 @@ async def test_hopli_should_be_able_to_fund_nodes(peer: str, swarm7: dict[str, N
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hopli_should_be_able_to_deregister_nodes_and_register_it(peer: str, swarm7: dict[str, Node]):
     test_suite_name = __name__.split('.')[-1]
     private_key = load_private_key(test_suite_name)
@@ -403,7 +405,7 @@ async def test_hopli_should_be_able_to_deregister_nodes_and_register_it(peer: st
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hopli_should_be_able_to_sync_eligibility_for_all_nodes(peer: str, swarm7: dict[str, Node]):
     test_suite_name = __name__.split('.')[-1]
     private_key = load_private_key(test_suite_name)
@@ -1,11 +1,14 @@
 import asyncio
+import itertools
 import random
 import re
 import string
-from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
 
+import aiohttp
 import pytest
-import requests
 
 from .conftest import (
     API_TOKEN,
@@ -17,6 +20,7 @@ from .conftest import (
     default_nodes,
     nodes_with_auth,
     random_distinct_pairs_from,
+    seeded_rng,
 )
 from .hopr import HoprdAPI
 from .node import Node
@@ -24,35 +28,131 @@ from .node import Node
 PARAMETERIZED_SAMPLE_SIZE = 1  # if os.getenv("CI", default="false") == "false" else 3
 AGGREGATED_TICKET_PRICE = TICKET_AGGREGATION_THRESHOLD * TICKET_PRICE_PER_HOP
 MULTIHOP_MESSAGE_SEND_TIMEOUT = 30.0
-CHECK_RETRY_INTERVAL = 0.5
+CHECK_RETRY_INTERVAL_START = 0.05
+CHECK_RETRY_INTERVAL_MAX = 2.0
+CHECK_RETRY_BACKOFF = 1.6
+MESSAGE_POLL_INTERVAL = 0.2
+DELIVERY_POLL_INTERVAL = 0.05
+MESSAGE_SEND_CONCURRENCY = 64
+CHANNELS_CACHE_TTL = 0.25
+TICKET_STATS_CACHE_TTL = 0.1
+MULTISET_COMPARE_MAX_PACKETS = 8
 APPLICATION_TAG_THRESHOLD_FOR_SESSIONS = RESERVED_TAG_UPPER_BOUND + 1
 
 # used by nodes to get unique port assignments
 PORT_BASE = 19000
 
+MAXIMUM_PAYLOAD_SIZE = 500
+_TOO_LARGE_PAYLOAD = "0 hop message too large: " + "".join(
+    random.choices(string.ascii_uppercase + string.digits, k=MAXIMUM_PAYLOAD_SIZE)
+)
+
+_ADDR_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
 
-def shuffled(coll):
-    random.shuffle(coll)
-    return coll
+_rng = seeded_rng(__name__)
 
 
 def gen_random_tag():
     return random.randint(APPLICATION_TAG_THRESHOLD_FOR_SESSIONS, 65530)
 
 
+class SingleFlight:
+    """
+    Memoizes coroutine results per key for `ttl` seconds, concurrent misses on the same key share one in-flight call.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._cache: dict[object, tuple[float, object]] = {}
+        self._inflight: dict[object, asyncio.Future] = {}
+        # bumped on invalidation, so that calls started before it are not cached
+        self._generations: dict[object, int] = {}
+
+    async def get(self, key, factory, max_age: float = None):
+        max_age = self.ttl if max_age is None else max_age
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            generation = self._generations.get(key, 0)
+
+            async def call():
+                value = await factory()
+                if self._generations.get(key, 0) == generation:
+                    self._cache[key] = (time.monotonic(), value)
+                return value
+
+            def forget(future):
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+            inflight = asyncio.ensure_future(call())
+            inflight.add_done_callback(forget)
+            self._inflight[key] = inflight
+
+        # a waiter timing out must not cancel the call shared with the other waiters
+        return await asyncio.shield(inflight)
+
+    def invalidate(self, *keys):
+        for key in keys or set(self._cache) | set(self._inflight):
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._cache.pop(key, None)
+            self._inflight.pop(key, None)
+
+
+# `all_channels` responses and their (source, destination) index keyed by (node address, include_closed)
+_channel_listings = SingleFlight(CHANNELS_CACHE_TTL)
+
+
+def index_channels_by_pair(all_channels) -> dict:
+    by_pair = {}
+    for oc in all_channels.all if all_channels is not None else []:
+        by_pair.setdefault((oc.source_address, oc.destination_address), oc)
+    return by_pair
+
+
+async def cached_all_channels(node: Node, include_closed: bool):
+    all_channels, _ = await cached_channel_listing(node, include_closed)
+    return all_channels
+
+
+async def cached_channels_by_pair(node: Node, include_closed: bool, max_age: float = None) -> dict:
+    _, by_pair = await cached_channel_listing(node, include_closed, max_age)
+    return by_pair
+
+
+async def cached_channel_listing(node: Node, include_closed: bool, max_age: float = None):
+    async def fetch():
+        all_channels = await node.api.all_channels(include_closed=include_closed)
+        return all_channels, index_channels_by_pair(all_channels)
+
+    return await _channel_listings.get((node.address, include_closed), fetch, max_age)
+
+
+def invalidate_cached_channels(*nodes: Node):
+    _channel_listings.invalidate(
+        *[(node.address, include_closed) for node in nodes for include_closed in (True, False)]
+    )
+
+
 @asynccontextmanager
 async def create_channel(src: Node, dest: Node, funding: int, close_from_dest=True):
     channel = await src.api.open_channel(dest.address, str(int(funding)))
     assert channel is not None
+    invalidate_cached_channels(src, dest)
     await asyncio.wait_for(check_channel_status(src, dest, status="Open"), 10.0)
     try:
         yield channel
     finally:
         if close_from_dest:
             assert await dest.api.close_channel(channel)
+            invalidate_cached_channels(src, dest)
             await asyncio.wait_for(check_channel_status(src, dest, status="Closed"), 10.0)
         else:
             assert await src.api.close_channel(channel)
+            invalidate_cached_channels(src, dest)
             await asyncio.wait_for(check_channel_status(src, dest, status="PendingToClose"), 10.0)
 
             # need to wait some more time until closure time has passed and the
@@ -60,163 +160,291 @@ async def create_channel(src: Node, dest: Node, funding: int, close_from_dest=Tr
             await asyncio.sleep(15)
 
             assert await src.api.close_channel(channel)
+            invalidate_cached_channels(src, dest)
             await asyncio.wait_for(check_channel_status(src, dest, status="Closed"), 10.0)
 
 
-async def get_channel(src: Node, dest: Node, include_closed=False):
-    all_channels = await src.api.all_channels(include_closed=include_closed)
+@asynccontextmanager
+async def create_channels(*channel_contexts):
+    """
+    Enters the given `create_channel` contexts concurrently and, on exit, closes all opened channels concurrently.
+    """
+    entered = []
 
-    channels = [
-        oc for oc in all_channels.all if oc.source_address == src.address and oc.destination_address == dest.address
-    ]
+    async def enter(ctx):
+        channel = await ctx.__aenter__()
+        entered.append(ctx)
+        return channel
+
+    results = await asyncio.gather(*(enter(ctx) for ctx in channel_contexts), return_exceptions=True)
+    try:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        yield results
+    finally:
+        await asyncio.gather(*(ctx.__aexit__(None, None, None) for ctx in entered))
+
+
+class TicketStatsCache:
+    """
+    Ticket statistics snapshots shared by the checks running within a single test.
+    """
 
-    return channels[0] if len(channels) > 0 else None
+    def __init__(self):
+        self._snapshots = SingleFlight(TICKET_STATS_CACHE_TTL)
 
+    async def get(self, node: Node, max_age: float = TICKET_STATS_CACHE_TTL):
+        return await self._snapshots.get(node.address, node.api.get_tickets_statistics, max_age)
+
+    def invalidate(self):
+        self._snapshots.invalidate()
+
+
+@pytest.fixture
+def stats_cache():
+    return TicketStatsCache()
+
+
+async def get_tickets_statistics(src: Node, stats_cache: TicketStatsCache = None):
+    if stats_cache is not None:
+        return await stats_cache.get(src)
+    return await src.api.get_tickets_statistics()
 
-async def get_channel_seen_from_dst(src: Node, dest: Node, include_closed=False):
-    open_channels = await dest.api.all_channels(include_closed=include_closed)
-    channels = [
-        oc for oc in open_channels.all if oc.source_address == src.address and oc.destination_address == dest.address
-    ]
 
-    return channels[0] if len(channels) > 0 else None
+async def get_channel(src: Node, dest: Node, include_closed=False, max_age: float = None):
+    by_pair = await cached_channels_by_pair(src, include_closed, max_age)
+    return by_pair.get((src.address, dest.address))
+
+
+async def get_channel_seen_from_dst(src: Node, dest: Node, include_closed=False, max_age: float = None):
+    by_pair = await cached_channels_by_pair(dest, include_closed, max_age)
+    return by_pair.get((src.address, dest.address))
+
+
+def backoff_intervals(start=CHECK_RETRY_INTERVAL_START, cap=CHECK_RETRY_INTERVAL_MAX, factor=CHECK_RETRY_BACKOFF):
+    delay = start
+    while True:
+        yield delay
+        delay = min(delay * factor, cap)
+
+
+def channel_status_poll_intervals():
+    # channel state changes are expected within a few seconds, keep the tail of the schedule short
+    return itertools.chain([0.05] * 4, [0.1] * 4, itertools.repeat(0.5))
+
+
+async def _poll(check_fn, intervals=None):
+    """
+    Await `check_fn` until it returns True, sleeping between attempts according to `intervals` (exponential backoff
+    by default).
+    """
+    intervals = iter(intervals if intervals is not None else backoff_intervals())
+    while not await check_fn():
+        await asyncio.sleep(next(intervals))
+
+
+async def peers_stream(node: Node):
+    """
+    Yields the set of connected peers of `node` every time it changes.
+
+    hoprd exposes no push-based peer endpoint, so changes are detected by polling with backoff; the polling restarts
+    at the shortest interval whenever the peer set changes.
+    """
+    last_peers = None
+    intervals = backoff_intervals()
+    while True:
+        peers = {x["peer_id"] for x in await node.api.peers()}
+        if peers != last_peers:
+            last_peers = peers
+            intervals = backoff_intervals()
+            yield peers
+
+        await asyncio.sleep(next(intervals))
 
 
 async def check_channel_status(src: Node, dest: Node, status: str):
     assert status in ["Open", "PendingToClose", "Closed"]
     include_closed = status == "Closed"
-    while True:
-        channel = await get_channel(src, dest, include_closed)
-        channel_seen_from_dst = await get_channel_seen_from_dst(src, dest, include_closed)
-        if (
+
+    # every poll wants a fresh listing, concurrent checks on the same node still share the in-flight request
+    async def has_status():
+        channel, channel_seen_from_dst = await asyncio.gather(
+            get_channel(src, dest, include_closed, max_age=0),
+            get_channel_seen_from_dst(src, dest, include_closed, max_age=0),
+        )
+        return (
             channel is not None
             and channel.status == status
             and channel_seen_from_dst is not None
             and channel_seen_from_dst.status == status
-        ):
-            break
-        else:
-            await asyncio.sleep(CHECK_RETRY_INTERVAL)
+        )
+
+    await _poll(has_status, channel_status_poll_intervals())
 
 
 async def check_outgoing_channel_closed(src: Node, channel_id: str):
-    while True:
+    async def is_closed():
         channel = await src.api.get_channel(channel_id)
-        if channel is not None and channel.status == "Closed":
-            break
-        else:
-            await asyncio.sleep(CHECK_RETRY_INTERVAL)
+        return channel is not None and channel.status == "Closed"
 
+    await _poll(is_closed)
 
-async def check_received_packets_with_pop(receiver: Node, expected_packets, tag=None, sort=True):
-    received = []
 
-    while len(received) != len(expected_packets):
-        packet = await receiver.api.messages_pop(tag)
-        if packet is not None:
-            received.append(packet.body)
-        else:
-            await asyncio.sleep(CHECK_RETRY_INTERVAL)
+def assert_received_packets(received: list[str], expected_packets: list[str], sort: bool, expected_sorted: bool):
+    if sort and len(expected_packets) <= MULTISET_COMPARE_MAX_PACKETS:
+        assert Counter(received) == Counter(expected_packets), f"Expected: {expected_packets}, got: {received}"
+        return
 
     if sort:
-        expected_packets.sort()
+        if not expected_sorted:
+            expected_packets.sort()
         received.sort()
 
-    assert received == expected_packets
+    assert received == expected_packets, f"Expected: {expected_packets}, got: {received}"
+
+
+async def check_received_packets_with_pop(
+    receiver: Node, expected_packets, tag=None, sort=True, expected_sorted: bool = True
+):
+    received = []
+
+    async def all_received():
+        # keep draining while pops return messages, only an empty inbox waits for the next poll
+        while len(received) < len(expected_packets):
+            packets = await receiver.api.messages_pop_all(tag)
+            if packets is None or not packets.messages:
+                return False
+            received.extend(m.body for m in packets.messages)
+        return True
 
+    await _poll(all_received, backoff_intervals(cap=MESSAGE_POLL_INTERVAL))
 
-async def check_received_packets_with_peek(receiver: Node, expected_packets: list[str], tag=None, sort=True):
+    assert_received_packets(received, expected_packets, sort, expected_sorted)
+
+
+async def check_received_packets_with_peek(
+    receiver: Node, expected_packets: list[str], tag=None, sort=True, expected_sorted: bool = True
+):
     received = []
 
-    while len(received) != len(expected_packets):
+    async def all_received():
+        nonlocal received
         packets = await receiver.api.messages_peek_all(tag)
+        if packets is not None:
+            received = [m.body for m in packets.messages]
+        return len(received) >= len(expected_packets)
 
-        if packets is None:
-            await asyncio.sleep(CHECK_RETRY_INTERVAL)
-            continue
+    await _poll(all_received, backoff_intervals(cap=MESSAGE_POLL_INTERVAL))
 
-        received = [m.body for m in packets.messages]
+    assert_received_packets(received, expected_packets, sort, expected_sorted)
 
-    if sort:
-        expected_packets.sort()
-        received.sort()
 
-    assert received == expected_packets, f"Expected: {expected_packets}, got: {received}"
+async def wait_until_delivered(dest: Node, tag: int, expected_count: int):
+    async def is_delivered():
+        packets = await dest.api.messages_peek_all(tag)
+        return packets is not None and len(packets.messages) >= expected_count
+
+    await _poll(is_delivered, itertools.repeat(DELIVERY_POLL_INTERVAL))
+
 
+async def check_rejected_tickets_value(src: Node, value: int, stats_cache: TicketStatsCache = None):
+    async def is_reached():
+        return balance_str_to_int((await get_tickets_statistics(src, stats_cache)).rejected_value) >= value
 
-async def check_rejected_tickets_value(src: Node, value: int):
-    while balance_str_to_int((await src.api.get_tickets_statistics()).rejected_value) < value:
-        await asyncio.sleep(CHECK_RETRY_INTERVAL)
+    await _poll(is_reached)
 
 
-async def check_unredeemed_tickets_value(src: Node, value: int):
-    while balance_str_to_int((await src.api.get_tickets_statistics()).unredeemed_value) < value:
-        await asyncio.sleep(CHECK_RETRY_INTERVAL)
+async def check_unredeemed_tickets_value(src: Node, value: int, stats_cache: TicketStatsCache = None):
+    async def is_reached():
+        return balance_str_to_int((await get_tickets_statistics(src, stats_cache)).unredeemed_value) >= value
+
+    await _poll(is_reached)
 
 
 async def check_safe_balance(src: Node, value: int):
-    while balance_str_to_int((await src.api.balances()).safe_hopr) != value:
-        await asyncio.sleep(CHECK_RETRY_INTERVAL)
+    async def is_reached():
+        return balance_str_to_int((await src.api.balances()).safe_hopr) == value
+
+    await _poll(is_reached)
 
 
 async def check_native_balance_below(src: Node, value: int):
-    while balance_str_to_int((await src.api.balances()).native) >= value:
-        await asyncio.sleep(CHECK_RETRY_INTERVAL)
+    async def is_below():
+        return balance_str_to_int((await src.api.balances()).native) < value
+
+    await _poll(is_below)
 
 
-async def check_all_tickets_redeemed(src: Node):
-    while balance_str_to_int((await src.api.get_tickets_statistics()).unredeemed_value) > 0:
-        await asyncio.sleep(CHECK_RETRY_INTERVAL)
+async def check_all_tickets_redeemed(src: Node, stats_cache: TicketStatsCache = None):
+    async def is_redeemed():
+        return balance_str_to_int((await get_tickets_statistics(src, stats_cache)).unredeemed_value) <= 0
+
+    await _poll(is_redeemed)
+
+
+async def _send_all(src: Node, dest_peer_id: str, packets, path, tag, concurrency=MESSAGE_SEND_CONCURRENCY):
+    """
+    Sends all `packets` from `src` with at most `concurrency` requests in flight, returns the responses in order.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_message(packet):
+        async with semaphore:
+            return await src.api.send_message(dest_peer_id, packet, path, tag)
+
+    return await asyncio.gather(*(send_message(packet) for packet in packets))
 
 
 async def send_and_receive_packets_with_pop(
-    packets, src: Node, dest: Node, path: str, timeout: int = MULTIHOP_MESSAGE_SEND_TIMEOUT
+    packets, src: Node, dest: Node, path: str, timeout: int = MULTIHOP_MESSAGE_SEND_TIMEOUT, expected_sorted=True
 ):
     random_tag = gen_random_tag()
 
-    for packet in packets:
-        assert await src.api.send_message(dest.peer_id, packet, path, random_tag)
+    assert all(await _send_all(src, dest.peer_id, packets, path, random_tag))
 
-    await asyncio.wait_for(check_received_packets_with_pop(dest, packets, tag=random_tag, sort=True), timeout)
+    await asyncio.wait_for(
+        check_received_packets_with_pop(dest, packets, tag=random_tag, sort=True, expected_sorted=expected_sorted),
+        timeout,
+    )
 
 
 async def send_and_receive_packets_with_peek(
-    packets, src: Node, dest: Node, path: str, timeout: int = MULTIHOP_MESSAGE_SEND_TIMEOUT
+    packets, src: Node, dest: Node, path: str, timeout: int = MULTIHOP_MESSAGE_SEND_TIMEOUT, expected_sorted=True
 ):
     random_tag = gen_random_tag()
 
-    for packet in packets:
-        assert await src.api.send_message(dest.peer_id, packet, path, random_tag)
+    assert all(await _send_all(src, dest.peer_id, packets, path, random_tag))
 
-    await asyncio.wait_for(check_received_packets_with_peek(dest, packets, tag=random_tag, sort=True), timeout)
+    await asyncio.wait_for(
+        check_received_packets_with_peek(dest, packets, tag=random_tag, sort=True, expected_sorted=expected_sorted),
+        timeout,
+    )
 
     return random_tag
 
 
-def balance_str_to_int(balance: str):
-    return int(balance.split(" ", 1)[0])
+def balance_str_to_int(balance: str) -> int:
+    head, _, _ = balance.partition(" ")
+    return int(head)
 
 
 # NOTE: this test is first, ensuring that all tests following it have ensured connectivity and
 # correct ticket price from api
 @pytest.mark.asyncio
 async def test_hoprd_swarm_connectivity(swarm7: dict[str, Node]):
-    async def check_all_connected(me: Node, others: list[str]):
-        others2 = set(others)
-        while True:
-            current_peers = set([x["peer_id"] for x in await me.api.peers()])
-            if current_peers.intersection(others) == others2:
+    async def check_all_connected(me: Node, others2: set[str]):
+        async for current_peers in peers_stream(me):
+            if others2.issubset(current_peers):
                 break
-            else:
-                assert current_peers.intersection(others2) == others2
-                await asyncio.sleep(0.5)
+
+    node_peer_ids = {k: v.peer_id for k, v in swarm7.items()}
+    all_barebone = barebone_nodes()
 
     await asyncio.gather(
         *[
-            asyncio.wait_for(
-                check_all_connected(swarm7[k], [swarm7[v].peer_id for v in barebone_nodes() if v != k]), 60.0
-            )
-            for k in barebone_nodes()
+            asyncio.wait_for(check_all_connected(swarm7[k], {node_peer_ids[v] for v in all_barebone if v != k}), 60.0)
+            for k in all_barebone
         ]
     )
 
@@ -229,41 +457,44 @@ async def test_hoprd_swarm_connectivity(swarm7: dict[str, Node]):
         print("Could not get ticket price from API, using default value")
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
-def test_hoprd_rest_api_should_reject_connection_without_any_auth(swarm7: dict[str, Node], peer: str):
-    url = f"http://{swarm7[peer].host_addr}:{swarm7[peer].api_port}/api/v3/node/version"
-
-    r = requests.get(url)
+@pytest.fixture(scope="module")
+async def http_session():
+    async with aiohttp.ClientSession() as session:
+        yield session
 
-    assert r.status_code == 401
 
-
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
-def test_hoprd_rest_api_should_reject_connection_with_invalid_token(peer: str, swarm7: dict[str, Node]):
+@pytest.mark.asyncio
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
+async def test_hoprd_rest_api_should_authenticate_connections_by_token(
+    peer: str, swarm7: dict[str, Node], http_session: aiohttp.ClientSession
+):
     url = f"http://{swarm7[peer].host_addr}:{swarm7[peer].api_port}/api/v3/node/version"
-    headers = {"X-Auth-Token": "DefiNItEly_A_baD_TokEn"}
-
-    r = requests.get(url, headers=headers)
-
-    assert r.status_code == 401
-
+    cases = [
+        # without any auth
+        ({}, 401),
+        # with an invalid token
+        ({"X-Auth-Token": "DefiNItEly_A_baD_TokEn"}, 401),
+        # with a valid token
+        ({"X-Auth-Token": f"{API_TOKEN}"}, 200),
+    ]
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
-def test_hoprd_rest_api_should_accept_connection_with_valid_token(peer: str, swarm7: dict[str, Node]):
-    url = f"http://{swarm7[peer].host_addr}:{swarm7[peer].api_port}/api/v3/node/version"
-    headers = {"X-Auth-Token": f"{API_TOKEN}"}
+    async def get_status(headers: dict):
+        async with http_session.get(url, headers=headers) as r:
+            return r.status
 
-    r = requests.get(url, headers=headers)
+    statuses = await asyncio.gather(*(get_status(headers) for headers, _ in cases))
 
-    assert r.status_code == 200
+    assert statuses == [expected_status for _, expected_status in cases]
 
 
 @pytest.mark.asyncio
 async def test_hoprd_protocol_check_balances_without_prior_tests(swarm7: dict[str, Node]):
-    for node in swarm7.values():
-        addr = await node.api.addresses("native")
-        assert re.match("^0x[0-9a-fA-F]{40}$", addr) is not None
-        balances = await node.api.balances()
+    results = await asyncio.gather(
+        *[asyncio.gather(node.api.addresses("native"), node.api.balances()) for node in swarm7.values()]
+    )
+
+    for addr, balances in results:
+        assert _ADDR_RE.match(addr) is not None
         native_balance = int(balances.native.split(" ")[0])
         hopr_balance = int(balances.safe_hopr.split(" ")[0])
         assert native_balance > 0
@@ -271,7 +502,7 @@ async def test_hoprd_protocol_check_balances_without_prior_tests(swarm7: dict[st
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hoprd_node_should_be_able_to_alias_other_peers(peer: str, swarm7: dict[str, Node]):
     other_peers = barebone_nodes()
     other_peers.remove(peer)
@@ -293,7 +524,9 @@ async def test_hoprd_node_should_be_able_to_alias_other_peers(peer: str, swarm7:
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_ping_should_work_between_nodes_in_the_same_network(src: str, dest: str, swarm7: dict[str, Node]):
     response = await swarm7[src].api.ping(swarm7[dest].peer_id)
 
@@ -302,7 +535,7 @@ async def test_hoprd_ping_should_work_between_nodes_in_the_same_network(src: str
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hoprd_ping_to_self_should_fail(peer: str, swarm7: dict[str, Node]):
     response = await swarm7[peer].api.ping(swarm7[peer].peer_id)
 
@@ -350,7 +583,9 @@ async def test_hoprd_should_not_have_unredeemed_tickets_without_sending_messages
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_be_able_to_send_0_hop_messages_without_open_channels(
     src: Node, dest: Node, swarm7: dict[str, Node]
 ):
@@ -361,23 +596,24 @@ async def test_hoprd_should_be_able_to_send_0_hop_messages_without_open_channels
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src, dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_fail_sending_a_message_that_is_too_large(src: Node, dest: Node, swarm7: dict[str, Node]):
-    MAXIMUM_PAYLOAD_SIZE = 500
     random_tag = gen_random_tag()
 
-    packet = "0 hop message too large: " + "".join(
-        random.choices(string.ascii_uppercase + string.digits, k=MAXIMUM_PAYLOAD_SIZE)
-    )
-    assert await swarm7[src].api.send_message(swarm7[dest].peer_id, packet, [], random_tag) is None
+    assert await swarm7[src].api.send_message(swarm7[dest].peer_id, _TOO_LARGE_PAYLOAD, [], random_tag) is None
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", [tuple(shuffled(barebone_nodes())[:2]) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_api_channel_should_register_fund_increase_using_fund_endpoint(
     src: str, dest: str, swarm7: dict[str, Node]
 ):
     hopr_amount = f"{OPEN_CHANNEL_FUNDING_VALUE_HOPR * 1e18:.0f}"  # convert HOPR to weiHOPR
+    hopr_amount_value = balance_str_to_int(hopr_amount)
 
     async with create_channel(swarm7[src], swarm7[dest], funding=TICKET_PRICE_PER_HOP) as channel:
         balance_before = await swarm7[src].api.balances()
@@ -388,29 +624,31 @@ async def test_hoprd_api_channel_should_register_fund_increase_using_fund_endpoi
         channel_after = await swarm7[src].api.get_channel(channel)
 
         # Updated channel balance is visible immediately
-        assert balance_str_to_int(channel_after.balance) - balance_str_to_int(
-            channel_before.balance
-        ) == balance_str_to_int(hopr_amount)
+        assert (
+            balance_str_to_int(channel_after.balance) - balance_str_to_int(channel_before.balance) == hopr_amount_value
+        )
 
         # Wait until the safe balance has decreased
         await asyncio.wait_for(
-            check_safe_balance(
-                swarm7[src], balance_str_to_int(balance_before.safe_hopr) - balance_str_to_int(hopr_amount)
-            ),
+            check_safe_balance(swarm7[src], balance_str_to_int(balance_before.safe_hopr) - hopr_amount_value),
             20.0,
         )
 
         # Safe allowance can be checked too at this point
         balance_after = await swarm7[src].api.balances()
-        assert balance_str_to_int(balance_before.safe_hopr_allowance) - balance_str_to_int(
-            balance_after.safe_hopr_allowance
-        ) == balance_str_to_int(hopr_amount)
+        assert (
+            balance_str_to_int(balance_before.safe_hopr_allowance)
+            - balance_str_to_int(balance_after.safe_hopr_allowance)
+            == hopr_amount_value
+        )
 
         await asyncio.wait_for(check_native_balance_below(swarm7[src], balance_str_to_int(balance_before.native)), 20.0)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", [tuple(shuffled(barebone_nodes())[:2]) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_api_should_redeem_tickets_in_channel_using_redeem_endpoint(
     src: Node, dest: Node, swarm7: dict[str, Node]
 ):
@@ -425,14 +663,7 @@ async def test_hoprd_api_should_redeem_tickets_in_channel_using_redeem_endpoint(
 
         await asyncio.wait_for(check_unredeemed_tickets_value(swarm7[dest], message_count * TICKET_PRICE_PER_HOP), 30.0)
 
-        async def channel_redeem_tickets(api: HoprdAPI, channel: str):
-            while True:
-                if await api.channel_redeem_tickets(channel):
-                    break
-                else:
-                    await asyncio.sleep(0.5)
-
-        await asyncio.wait_for(channel_redeem_tickets(swarm7[dest].api, channel), 20.0)
+        await asyncio.wait_for(_poll(lambda: swarm7[dest].api.channel_redeem_tickets(channel)), 20.0)
 
         await asyncio.wait_for(check_all_tickets_redeemed(swarm7[dest]), 120.0)
 
@@ -440,9 +671,11 @@ async def test_hoprd_api_should_redeem_tickets_in_channel_using_redeem_endpoint(
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", [tuple(shuffled(barebone_nodes())[:2]) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_fail_sending_a_message_when_the_channel_is_out_of_funding(
-    src: str, dest: Node, swarm7: dict[str, Node]
+    src: str, dest: Node, swarm7: dict[str, Node], stats_cache: TicketStatsCache
 ):
     """
     # FIXME: The following part can be enabled once incoming channel closure is
@@ -481,18 +714,9 @@ async def test_hoprd_should_fail_sending_a_message_when_the_channel_is_out_of_fu
 
     message_count = 2
 
-    async with AsyncExitStack() as channels:
-        await asyncio.gather(
-            *[
-                channels.enter_async_context(
-                    create_channel(
-                        swarm7[i[0]], swarm7[i[1]], funding=message_count * TICKET_PRICE_PER_HOP, close_from_dest=False
-                    )
-                )
-                for i in [[src, dest]]
-            ]
-        )
-
+    async with create_channel(
+        swarm7[src], swarm7[dest], funding=message_count * TICKET_PRICE_PER_HOP, close_from_dest=False
+    ):
         packets = [f"Channel agg and redeem on 1-hop: {src} - {dest} - {src} #{i:08d}" for i in range(message_count)]
         await send_and_receive_packets_with_pop(packets, src=swarm7[src], dest=swarm7[src], path=[swarm7[dest].peer_id])
 
@@ -501,21 +725,30 @@ async def test_hoprd_should_fail_sending_a_message_when_the_channel_is_out_of_fu
             swarm7[src].peer_id, "THIS MSG IS NOT COVERED", [swarm7[dest].peer_id]
         )
 
-        await asyncio.wait_for(check_unredeemed_tickets_value(swarm7[dest], message_count * TICKET_PRICE_PER_HOP), 30.0)
-
-        # we should see the last message as rejected
-        await asyncio.wait_for(check_rejected_tickets_value(swarm7[dest], 1), 120.0)
+        # we should see the covered messages as unredeemed and the last message as rejected
+        await asyncio.gather(
+            asyncio.wait_for(
+                check_unredeemed_tickets_value(
+                    swarm7[dest], message_count * TICKET_PRICE_PER_HOP, stats_cache=stats_cache
+                ),
+                30.0,
+            ),
+            asyncio.wait_for(check_rejected_tickets_value(swarm7[dest], 1, stats_cache=stats_cache), 120.0),
+        )
 
         await asyncio.sleep(10)  # wait for aggregation to finish
         assert await swarm7[dest].api.tickets_redeem()
+        stats_cache.invalidate()
 
-        await asyncio.wait_for(check_all_tickets_redeemed(swarm7[dest]), 120.0)
+        await asyncio.wait_for(check_all_tickets_redeemed(swarm7[dest], stats_cache=stats_cache), 120.0)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", [tuple(shuffled(barebone_nodes())[:2]) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_create_redeemable_tickets_on_routing_in_1_hop_to_self_scenario(
-    src: str, dest: str, swarm7: dict[str, Node]
+    src: str, dest: str, swarm7: dict[str, Node], stats_cache: TicketStatsCache
 ):
     # send 90% of messages before ticket aggregation would kick in
     message_count = int(TICKET_AGGREGATION_THRESHOLD / 10 * 9)
@@ -527,18 +760,21 @@ async def test_hoprd_should_create_redeemable_tickets_on_routing_in_1_hop_to_sel
         statistics_before = await swarm7[dest].api.get_tickets_statistics()
         assert balance_str_to_int(statistics_before.unredeemed_value) == 0
 
-        packets = [
-            f"1 hop message to self: {src} - {dest} - {src} #{i:08d} of #{message_count:08d}"
-            for i in range(message_count)
-        ]
+        # the zero-padded counter keeps the packets in sorted order
+        prefix = f"1 hop message to self: {src} - {dest} - {src} #"
+        suffix = f" of #{message_count:08d}"
+        packets = [f"{prefix}{i:08d}{suffix}" for i in range(message_count)]
         await send_and_receive_packets_with_pop(
             packets, src=swarm7[src], dest=swarm7[src], path=[swarm7[dest].peer_id], timeout=60.0
         )
 
-        await asyncio.wait_for(check_unredeemed_tickets_value(swarm7[dest], message_count * TICKET_PRICE_PER_HOP), 30.0)
+        await asyncio.wait_for(
+            check_unredeemed_tickets_value(swarm7[dest], message_count * TICKET_PRICE_PER_HOP, stats_cache=stats_cache),
+            30.0,
+        )
 
         # ensure ticket stats are updated after messages are sent
-        statistics_after = await swarm7[dest].api.get_tickets_statistics()
+        statistics_after = await stats_cache.get(swarm7[dest])
 
         unredeemed_value = balance_str_to_int(statistics_after.unredeemed_value) - balance_str_to_int(
             statistics_before.unredeemed_value
@@ -548,11 +784,12 @@ async def test_hoprd_should_create_redeemable_tickets_on_routing_in_1_hop_to_sel
         assert unredeemed_value == (len(packets) * TICKET_PRICE_PER_HOP)
 
         assert await swarm7[dest].api.channel_redeem_tickets(channel_id)
+        stats_cache.invalidate()
 
-        await asyncio.wait_for(check_all_tickets_redeemed(swarm7[dest]), 120.0)
+        await asyncio.wait_for(check_all_tickets_redeemed(swarm7[dest], stats_cache=stats_cache), 120.0)
 
         # ensure ticket stats are updated after redemption
-        statistics_after_redemption = await swarm7[dest].api.get_tickets_statistics()
+        statistics_after_redemption = await stats_cache.get(swarm7[dest])
         assert (
             balance_str_to_int(statistics_after_redemption.redeemed_value)
             - balance_str_to_int(statistics_after.redeemed_value)
@@ -561,7 +798,9 @@ async def test_hoprd_should_create_redeemable_tickets_on_routing_in_1_hop_to_sel
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", [tuple(shuffled(barebone_nodes())[:2]) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_aggregate_and_redeem_tickets_in_channel_on_api_request(
     src: str, dest: str, swarm7: dict[str, Node]
 ):
@@ -592,28 +831,24 @@ async def test_hoprd_should_aggregate_and_redeem_tickets_in_channel_on_api_reque
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "route",
-    [shuffled(barebone_nodes())[:3] for _ in range(PARAMETERIZED_SAMPLE_SIZE)],
-    # + [shuffled(nodes())[:5] for _ in range(PARAMETERIZED_SAMPLE_SIZE)],
+    [_rng.sample(barebone_nodes(), 3) for _ in range(PARAMETERIZED_SAMPLE_SIZE)],
 )
 async def test_hoprd_should_create_redeemable_tickets_on_routing_in_general_n_hop(route, swarm7: dict[str, Node]):
     message_count = int(TICKET_AGGREGATION_THRESHOLD / 10)
 
-    async with AsyncExitStack() as channels:
-        await asyncio.gather(
-            *[
-                channels.enter_async_context(
-                    create_channel(swarm7[route[i]], swarm7[route[i + 1]], funding=message_count * TICKET_PRICE_PER_HOP)
-                )
-                for i in range(len(route) - 1)
-            ]
-        )
-
+    async with create_channels(
+        *[
+            create_channel(swarm7[route[i]], swarm7[route[i + 1]], funding=message_count * TICKET_PRICE_PER_HOP)
+            for i in range(len(route) - 1)
+        ]
+    ):
+        path_peer_ids = [swarm7[x].peer_id for x in route[1:-1]]
         packets = [f"General n-hop over {route} message #{i:08d}" for i in range(message_count)]
         await send_and_receive_packets_with_pop(
             packets,
             src=swarm7[route[0]],
             dest=swarm7[route[-1]],
-            path=[swarm7[x].peer_id for x in route[1:-1]],
+            path=path_peer_ids,
         )
 
         await asyncio.wait_for(
@@ -627,20 +862,16 @@ async def test_hoprd_should_create_redeemable_tickets_on_routing_in_general_n_ho
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("route", [shuffled(barebone_nodes())[:3] for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
+@pytest.mark.parametrize("route", [_rng.sample(barebone_nodes(), 3) for _ in range(PARAMETERIZED_SAMPLE_SIZE)])
 async def test_hoprd_should_be_able_to_close_open_channels_with_unredeemed_tickets(route, swarm7: dict[str, Node]):
     ticket_count = 2
 
-    async with AsyncExitStack() as channels:
-        await asyncio.gather(
-            *[
-                channels.enter_async_context(
-                    create_channel(swarm7[route[i]], swarm7[route[i + 1]], funding=ticket_count * TICKET_PRICE_PER_HOP)
-                )
-                for i in range(len(route) - 1)
-            ]
-        )
-
+    async with create_channels(
+        *[
+            create_channel(swarm7[route[i]], swarm7[route[i + 1]], funding=ticket_count * TICKET_PRICE_PER_HOP)
+            for i in range(len(route) - 1)
+        ]
+    ):
         packets = [f"Channel unredeemed check: #{i:08d}" for i in range(ticket_count)]
         await send_and_receive_packets_with_pop(
             packets, src=swarm7[route[0]], dest=swarm7[route[-1]], path=[swarm7[route[1]].peer_id]
@@ -654,7 +885,9 @@ async def test_hoprd_should_be_able_to_close_open_channels_with_unredeemed_ticke
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_hoprd_should_be_able_to_open_and_close_channel_without_tickets(
     src: str, dest: str, swarm7: dict[str, Node]
 ):
@@ -669,9 +902,9 @@ async def test_hoprd_should_be_able_to_open_and_close_channel_without_tickets(
     "route",
     [
         [
-            random.sample(barebone_nodes(), 1)[0],
-            random.sample(default_nodes(), 1)[0],
-            random.sample(barebone_nodes(), 1)[0],
+            _rng.choice(barebone_nodes()),
+            _rng.choice(default_nodes()),
+            _rng.choice(barebone_nodes()),
         ]
         for _ in range(PARAMETERIZED_SAMPLE_SIZE)
     ],
@@ -697,20 +930,16 @@ async def test_hoprd_default_strategy_automatic_ticket_aggregation_and_redeeming
 
         # monitor that the node aggregates and redeems tickets until the aggregated value is reached
         async def check_aggregate_and_redeem_tickets(api: HoprdAPI):
-            while True:
-                statistics_now = await api.get_tickets_statistics()
-                assert statistics_now is not None
+            statistics_now = await api.get_tickets_statistics()
+            assert statistics_now is not None
 
-                redeemed_value_now = balance_str_to_int(statistics_now.redeemed_value)
-                redeemed_value_diff = redeemed_value_now - redeemed_value_at_start
+            redeemed_value_now = balance_str_to_int(statistics_now.redeemed_value)
+            redeemed_value_diff = redeemed_value_now - redeemed_value_at_start
 
-                # break out of the loop if the aggregated value is reached
-                if redeemed_value_diff >= AGGREGATED_TICKET_PRICE:
-                    break
-                else:
-                    await asyncio.sleep(0.1)
+            # the aggregated value is reached
+            return redeemed_value_diff >= AGGREGATED_TICKET_PRICE
 
-        await asyncio.wait_for(check_aggregate_and_redeem_tickets(swarm7[mid].api), 60.0)
+        await asyncio.wait_for(_poll(lambda: check_aggregate_and_redeem_tickets(swarm7[mid].api)), 60.0)
 
 
 # FIXME: This test depends on side-effects and cannot be run on its own. It
@@ -720,10 +949,10 @@ async def test_hoprd_sanity_check_channel_status(swarm7: dict[str, Node]):
     """
     The bash integration-test.sh opens and closes channels that can be visible inside this test scope
     """
-    alice_api = swarm7["1"].api
+    alice = swarm7["1"]
 
-    open_channels = await alice_api.all_channels(include_closed=False)
-    open_and_closed_channels = await alice_api.all_channels(include_closed=True)
+    open_channels = await cached_all_channels(alice, include_closed=False)
+    open_and_closed_channels = await cached_all_channels(alice, include_closed=True)
 
     assert len(open_and_closed_channels.all) >= len(open_channels.all), "Open and closed channels should be present"
 
@@ -761,7 +990,7 @@ async def test_hoprd_strategy_UNFINISHED():
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hoprd_check_native_withdraw(peer, swarm7: dict[str, Node]):
     amount = "9876"
     remaining_attempts = 10
@@ -780,7 +1009,7 @@ async def test_hoprd_check_native_withdraw(peer, swarm7: dict[str, Node]):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hoprd_check_ticket_price_is_default(peer, swarm7: dict[str, Node]):
     price = await swarm7[peer].api.ticket_price()
 
@@ -789,7 +1018,7 @@ async def test_hoprd_check_ticket_price_is_default(peer, swarm7: dict[str, Node]
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("peer", random.sample(barebone_nodes(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(barebone_nodes(), 1))
 async def test_hoprd_check_ticket_winn_prob_is_default(peer, swarm7: dict[str, Node]):
     price = await swarm7[peer].api.ticket_winn_prob()
 
@@ -798,7 +1027,7 @@ async def test_hoprd_check_ticket_winn_prob_is_default(peer, swarm7: dict[str, N
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("tag", [random.randint(0, RESERVED_TAG_UPPER_BOUND) for _ in range(5)])
+@pytest.mark.parametrize("tag", [_rng.randint(0, RESERVED_TAG_UPPER_BOUND) for _ in range(5)])
 async def test_send_message_with_reserved_application_tag_should_fail(tag: int, swarm7: dict[str, Node]):
     src, dest = random_distinct_pairs_from(barebone_nodes(), count=1)[0]
 
@@ -808,7 +1037,7 @@ async def test_send_message_with_reserved_application_tag_should_fail(tag: int,
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("tag", [random.randint(0, RESERVED_TAG_UPPER_BOUND) for _ in range(5)])
+@pytest.mark.parametrize("tag", [_rng.randint(0, RESERVED_TAG_UPPER_BOUND) for _ in range(5)])
 async def test_inbox_operations_with_reserved_application_tag_should_fail(tag: int, swarm7: dict[str, Node]):
     id = random.choice(barebone_nodes())
 
@@ -818,7 +1047,9 @@ async def test_inbox_operations_with_reserved_application_tag_should_fail(tag: i
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_peeking_messages_with_timestamp(src: str, dest: str, swarm7: dict[str, Node]):
     message_count = int(TICKET_AGGREGATION_THRESHOLD / 10)
     split_index = int(message_count * 0.66)
@@ -829,16 +1060,16 @@ async def test_peeking_messages_with_timestamp(src: str, dest: str, swarm7: dict
     dest_peer = swarm7[dest]
 
     packets = [f"0 hop message #{i:08d}" for i in range(message_count)]
-    for packet in packets[:split_index]:
-        await src_peer.api.send_message(dest_peer.peer_id, packet, [], random_tag)
+    await _send_all(src_peer, dest_peer.peer_id, packets[:split_index], [], random_tag)
 
-    await asyncio.sleep(2)
+    # the second batch must only be sent once the first one has been received
+    await asyncio.wait_for(wait_until_delivered(dest_peer, random_tag, split_index), MULTIHOP_MESSAGE_SEND_TIMEOUT)
 
-    for packet in packets[split_index:]:
-        await src_peer.api.send_message(dest_peer.peer_id, packet, [], random_tag)
+    await _send_all(src_peer, dest_peer.peer_id, packets[split_index:], [], random_tag)
 
     await asyncio.wait_for(
-        check_received_packets_with_peek(dest_peer, packets, tag=random_tag, sort=True), MULTIHOP_MESSAGE_SEND_TIMEOUT
+        check_received_packets_with_peek(dest_peer, packets, tag=random_tag, sort=True),
+        MULTIHOP_MESSAGE_SEND_TIMEOUT,
     )
 
     packets = await dest_peer.api.messages_peek_all(random_tag)
@@ -858,7 +1089,9 @@ async def test_peeking_messages_with_timestamp(src: str, dest: str, swarm7: dict
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE))
+@pytest.mark.parametrize(
+    "src,dest", random_distinct_pairs_from(barebone_nodes(), count=PARAMETERIZED_SAMPLE_SIZE, rng=_rng)
+)
 async def test_send_message_return_timestamp(src: str, dest: str, swarm7: dict[str, Node]):
     message_count = int(TICKET_AGGREGATION_THRESHOLD / 10)
     random_tag = gen_random_tag()
@@ -867,6 +1100,8 @@ async def test_send_message_return_timestamp(src: str, dest: str, swarm7: dict[s
     dest_peer = swarm7[dest]
 
     packets = [f"0 hop message #{i:08d}" for i in range(message_count)]
+
+    # sends stay serial, concurrent requests may reach hoprd out of submission order
     timestamps = []
     for packet in packets:
         res = await src_peer.api.send_message(dest_peer.peer_id, packet, [], random_tag)
@@ -1,9 +1,9 @@
 import asyncio
-from contextlib import AsyncExitStack
 import json
 import os
 import random
 import time
+from contextlib import ExitStack, closing
 
 import logging
 import pytest
@@ -12,7 +12,7 @@ import websockets
 from .conftest import TICKET_PRICE_PER_HOP, to_ws_url
 from .hopr import HoprdAPI
 from .node import Node
-from .test_integration import create_channel
+from .test_integration import create_channel, create_channels
 
 
 logging.basicConfig(format="%(asctime)s %(message)s")
@@ -60,81 +60,83 @@ class ApiWrapper:
 async def test_stress_relayed_flood_test_with_sources_performing_1_hop_to_self(stress_fixture, swarm7: dict[str, Node]):
     STRESS_1_HOP_TO_SELF_MESSAGE_COUNT = stress_fixture["request_count"]
 
-    api_sources = [HoprdAPI(f'http://{d["url"]}', d["token"]) for d in stress_fixture["sources"]]
-    api_target = HoprdAPI(f'http://{stress_fixture["target"]["url"]}', stress_fixture["target"]["token"])
-    target_peer_id = await api_target.addresses("hopr")
+    with ExitStack() as clients:
+        api_sources = [
+            clients.enter_context(closing(HoprdAPI(f'http://{d["url"]}', d["token"])))
+            for d in stress_fixture["sources"]
+        ]
+        api_target = clients.enter_context(
+            closing(HoprdAPI(f'http://{stress_fixture["target"]["url"]}', stress_fixture["target"]["token"]))
+        )
+        target_peer_id = await api_target.addresses("hopr")
 
-    async with AsyncExitStack() as channels:
         await asyncio.gather(
             *[asyncio.wait_for(peer_is_present(source, target_peer_id), timeout=15.0) for source in api_sources]
         )
 
-        await asyncio.gather(
+        async with create_channels(
             *[
-                channels.enter_async_context(
-                    create_channel(
-                        ApiWrapper(source, await source.addresses("native")),
-                        ApiWrapper(api_target, await api_target.addresses("native")),
-                        funding=STRESS_1_HOP_TO_SELF_MESSAGE_COUNT * TICKET_PRICE_PER_HOP,
-                        close_from_dest=False,
-                    )
+                create_channel(
+                    ApiWrapper(source, await source.addresses("native")),
+                    ApiWrapper(api_target, await api_target.addresses("native")),
+                    funding=STRESS_1_HOP_TO_SELF_MESSAGE_COUNT * TICKET_PRICE_PER_HOP,
+                    close_from_dest=False,
                 )
                 for source in api_sources
             ]
-        )
-
-        async def send_and_receive_all_messages(host, port, token, self_peer_id, target_peer_id):
-            start_time = time.time()
-
-            async with websockets.connect(
-                f"{to_ws_url(host, port)}",
-                extra_headers=[("X-Auth-Token", token)],
-            ) as socket:
-                tag = random.randint(30000, 60000)
-                packets = [
-                    f"1 hop stress msg to self ({host}:{port}) through {target_peer_id} #{i+1:08d}/{STRESS_1_HOP_TO_SELF_MESSAGE_COUNT:08d}"
-                    for i in range(STRESS_1_HOP_TO_SELF_MESSAGE_COUNT)
-                ]
-
-                recv_packets = []
-
-                for packet in packets:
-                    msg = {
-                        "body": packet, "peerId": self_peer_id, "path": [target_peer_id], "tag": tag,
-                    }
-                    await socket.send(json.dumps(msg))
-
-                packets.sort()
-
-                # receive all messages
-                for _ in range(len(packets)):
-                    try:
-                        msg = await asyncio.wait_for(socket.recv(), timeout=5)
-                        recv_packets.append(json.loads(msg)["body"])
-                    except Exception:
-                        break
-
-                end_time = time.time()
-
-                logging.info(
-                    f"The websocket stress test ran at {STRESS_1_HOP_TO_SELF_MESSAGE_COUNT/(end_time - start_time)} packets/s/node"
-                )
+        ):
+            async def send_and_receive_all_messages(host, port, token, self_peer_id, target_peer_id):
+                start_time = time.time()
+
+                async with websockets.connect(
+                    f"{to_ws_url(host, port)}",
+                    extra_headers=[("X-Auth-Token", token)],
+                ) as socket:
+                    tag = random.randint(30000, 60000)
+                    packets = [
+                        f"1 hop stress msg to self ({host}:{port}) through {target_peer_id} #{i+1:08d}/{STRESS_1_HOP_TO_SELF_MESSAGE_COUNT:08d}"
+                        for i in range(STRESS_1_HOP_TO_SELF_MESSAGE_COUNT)
+                    ]
+
+                    recv_packets = []
+
+                    for packet in packets:
+                        msg = {
+                            "body": packet, "peerId": self_peer_id, "path": [target_peer_id], "tag": tag,
+                        }
+                        await socket.send(json.dumps(msg))
+
+                    packets.sort()
+
+                    # receive all messages
+                    for _ in range(len(packets)):
+                        try:
+                            msg = await asyncio.wait_for(socket.recv(), timeout=5)
+                            recv_packets.append(json.loads(msg)["body"])
+                        except Exception:
+                            break
+
+                    end_time = time.time()
+
+                    logging.info(
+                        f"The websocket stress test ran at {STRESS_1_HOP_TO_SELF_MESSAGE_COUNT/(end_time - start_time)} packets/s/node"
+                    )
                 
-                recv_packets.sort()
-                assert recv_packets == packets
-
-        await asyncio.gather(
-            *[
-                asyncio.wait_for(
-                    send_and_receive_all_messages(
-                        source["url"].split(":")[0],
-                        source["url"].split(":")[1],
-                        source["token"],
-                        await HoprdAPI(f'http://{source["url"]}', source["token"]).addresses("hopr"),
-                        target_peer_id,
-                    ),
-                    timeout=60.0,
-                )
-                for source in stress_fixture["sources"]
-            ]
-        )
+                    recv_packets.sort()
+                    assert recv_packets == packets
+
+            await asyncio.gather(
+                *[
+                    asyncio.wait_for(
+                        send_and_receive_all_messages(
+                            source["url"].split(":")[0],
+                            source["url"].split(":")[1],
+                            source["token"],
+                            await api_source.addresses("hopr"),
+                            target_peer_id,
+                        ),
+                        timeout=60.0,
+                    )
+                    for source, api_source in zip(stress_fixture["sources"], api_sources)
+                ]
+            )
@@ -8,17 +8,19 @@ import pytest
 import websocket
 import websockets
 
-from .conftest import API_TOKEN, nodes_with_auth, random_distinct_pairs_from, to_ws_url
+from .conftest import API_TOKEN, nodes_with_auth, random_distinct_pairs_from, seeded_rng, to_ws_url
 from .node import Node
 
 # used by nodes to get unique port assignments
 PORT_BASE = 19100
 
+_rng = seeded_rng(__name__)
+
 
 EXTRA_HEADERS = [("X-Auth-Token", API_TOKEN)]
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_reject_a_connection_without_a_valid_token(peer: str, swarm7: dict[str, Node]):
     ws = websocket.WebSocket()
     try:
@@ -29,7 +31,7 @@ def test_hoprd_websocket_api_should_reject_a_connection_without_a_valid_token(pe
         assert False
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_reject_a_connection_with_an_invalid_token(peer: str, swarm7: dict[str, Node]):
     ws = websocket.WebSocket()
     try:
@@ -43,7 +45,7 @@ def test_hoprd_websocket_api_should_reject_a_connection_with_an_invalid_token(pe
         assert False, "Failed to raise 401 on invalid token"
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_accept_a_connection_with_an_invalid_token_passed_through_websocket_protocol(
     peer: str, swarm7: dict[str, Node]
 ):
@@ -59,7 +61,7 @@ def test_hoprd_websocket_api_should_accept_a_connection_with_an_invalid_token_pa
         assert False, "Failed to raise 401 on invalid token"
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_reject_a_connection_with_an_invalid_bearer_token(
     peer: str, swarm7: dict[str, Node]
 ):
@@ -75,7 +77,7 @@ def test_hoprd_websocket_api_should_reject_a_connection_with_an_invalid_bearer_t
         assert False, "Failed to raise 401 on invalid token"
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_token(peer: str, swarm7: dict[str, Node]):
     ws = websocket.WebSocket()
     ws.connect(
@@ -86,7 +88,7 @@ def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_token(peer:
     time.sleep(0.5)
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_token_passed_through_websocket_protocol(
     peer: str, swarm7: dict[str, Node]
 ):
@@ -98,7 +100,7 @@ def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_token_passe
     time.sleep(0.5)
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_bearer_token(peer: str, swarm7: dict[str, Node]):
     ws = websocket.WebSocket()
     ws.connect(
@@ -109,7 +111,7 @@ def test_hoprd_websocket_api_should_accept_a_connection_with_a_valid_bearer_toke
     time.sleep(0.5)
 
 
-@pytest.mark.parametrize("peer", random.sample(nodes_with_auth(), 1))
+@pytest.mark.parametrize("peer", _rng.sample(nodes_with_auth(), 1))
 def test_hoprd_websocket_api_should_reject_connection_on_invalid_path(peer: str, swarm7: dict[str, Node]):
     ws = websocket.WebSocket()
     try:
@@ -138,7 +140,7 @@ async def ws_connections(swarm7: dict[str, Node]):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("src,dest", random_distinct_pairs_from(nodes_with_auth(), count=1))
+@pytest.mark.parametrize("src,dest", random_distinct_pairs_from(nodes_with_auth(), count=1, rng=_rng))
 async def test_websocket_send_receive_messages(src: str, dest: str, swarm7: dict[str, Node], ws_connections):
     tag = random.randint(30000, 60000)
     message_target_count = 10